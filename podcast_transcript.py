@@ -7,39 +7,278 @@ and extracts relevant transcript sections with context padding.
 
 import os
 import sys
+import io
 import json
+import mmap
+import asyncio
+import hashlib
+import time
+import shutil
+import argparse
 import tempfile
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Union
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import re
 
 try:
     import feedparser
     import requests
-    import whisper
+    import aiohttp
+    import ctranslate2
+    import numpy as np
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    from faster_whisper.feature_extractor import FeatureExtractor
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
 except ImportError as e:
-    print(f"Error: Missing required package. Install with: pip install feedparser requests openai-whisper")
+    print(f"Error: Missing required package. Install with: pip install feedparser requests aiohttp faster-whisper")
     sys.exit(1)
 
+# Optional: torch lets the log-Mel spectrogram be computed on the GPU
+try:
+    import torch
+except ImportError:
+    torch = None
+
+# Whisper operates on 16 kHz mono audio in windows of at most 30 seconds
+SAMPLE_RATE = 16000
+MAX_CHUNK_SECONDS = 30
+CHUNK_OVERLAP_SECONDS = 1
+
+# Parallel HTTP Range requests per download, and read size per request
+DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Minimum seconds between download progress updates
+PROGRESS_INTERVAL = 0.25
+
+# Conditional GET validators for fetched feeds, stored in the temp directory
+FEED_META_FILE = "feed_meta.json"
+
+# Decoded chunks buffered between download and transcription when streaming
+STREAM_QUEUE_CHUNKS = 16
+
+# Number of VAD chunks decoded per forward pass
+GPU_BATCH_SIZE = 16
+CPU_BATCH_SIZE = 4
+
+# Separators for console output and transcript extracts
+RULE = "=" * 80
+THIN_RULE = "-" * 80
+EXTRACT_HEADER = f"{RULE}\nTRANSCRIPT EXTRACT\n{RULE}\n"
+
+# Feed entry attributes that may carry the audio URL, in order of preference,
+# as (attribute, MIME type key, URL key)
+_AUDIO_SOURCES = (
+    ('enclosures', 'type', 'href'),
+    ('media_content', 'type', 'url'),
+    ('links', 'type', 'href'),
+)
+_AUDIO_TYPE_RE = re.compile(r'audio', re.IGNORECASE)
+
+
+class _FilenameCharTable(dict):
+    """str.translate table keeping alphanumerics, space, '-' and '_'.
+
+    Entries are filled in on first lookup, so any Unicode letter or digit
+    is kept (as with str.isalnum) while the table only grows to the
+    characters actually seen.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+
+_FILENAME_CHARS = _FilenameCharTable()
+
+# Loaded Whisper models, shared by every extractor in the process
+_MODEL_CACHE: Dict[Tuple[str, str], WhisperModel] = {}
+
+
+class GPUFeatureExtractor(FeatureExtractor):
+    """Whisper log-Mel feature extractor running on a CUDA device via torch.
+
+    Drop-in replacement for faster-whisper's NumPy FeatureExtractor: the mel
+    filter bank and Hann window are uploaded once, and the STFT, mel
+    projection and log compression run on the GPU. The (small) spectrogram
+    is copied back to host memory, which is what CTranslate2 expects.
+    """
+
+    def __init__(self, base: FeatureExtractor, device: str = "cuda"):
+        self.__dict__.update(base.__dict__)
+        self.device = device
+        self.mel_filters_gpu = torch.from_numpy(base.mel_filters).to(device)
+        self.window_gpu = torch.hann_window(self.n_fft, device=device)
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: Optional[int] = None) -> np.ndarray:
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+
+        audio = torch.from_numpy(np.ascontiguousarray(waveform, dtype=np.float32)).to(self.device)
+        if padding:
+            audio = torch.nn.functional.pad(audio, (0, padding))
+
+        stft = torch.stft(audio, self.n_fft, self.hop_length, window=self.window_gpu, return_complex=True)
+        magnitudes = stft[..., :-1].abs() ** 2
+
+        mel_spec = self.mel_filters_gpu @ magnitudes
+
+        log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+        log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+        log_spec = (log_spec + 4.0) / 4.0
+
+        return log_spec.cpu().numpy()
+
+
+@lru_cache(maxsize=None)
+def _format_pub_date(published: str) -> str:
+    """Format an RFC 822 feed date as YYYY-MM-DD HH:MM, or return it unchanged."""
+    try:
+        return parsedate_to_datetime(published).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return published
+
+
+class _DownloadProgress:
+    """Prints download percentage at most once per PROGRESS_INTERVAL, on a TTY only."""
+
+    def __init__(self, total_size: int):
+        self.total_size = total_size if sys.stdout.isatty() else 0
+        self.downloaded = 0
+        self.last_print = 0.0
+
+    def update(self, nbytes: int) -> None:
+        self.downloaded += nbytes
+        if not self.total_size:
+            return
+
+        now = time.monotonic()
+        if now - self.last_print >= PROGRESS_INTERVAL or self.downloaded >= self.total_size:
+            self.last_print = now
+            print(f"Downloaded: {self.downloaded / self.total_size * 100:.1f}%", end='\r')
+
+
+def _read_json(path: Path):
+    """Load a JSON cache file, or return None if it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a cache file atomically, so an interrupted run never leaves it truncated."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_json(path: Path, data) -> None:
+    """Write a JSON cache file atomically."""
+    _write_atomic(path, json.dumps(data).encode())
+
+
+def _default_compute_type(device: str) -> str:
+    """int8 weights with float16 activations on CUDA, int8 throughout on CPU."""
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+def _load_model(model_name: str, device: str, compute_type: Optional[str] = None) -> WhisperModel:
+    """Load a faster-whisper model for the given device.
+
+    Converted weights are fetched into the Hugging Face cache, which
+    follows HF_HOME / XDG_CACHE_HOME, so CI and Docker layers can keep
+    the checkpoint between runs. When several GPUs are present the model
+    is replicated on each, with one worker per GPU.
+
+    Args:
+        model_name: Whisper model size (tiny, base, small, medium, large)
+        device: "cuda" or "cpu"
+        compute_type: CTranslate2 compute type. Defaults to int8_float16 on
+            CUDA (int8 weights, float16 activations) and int8 on CPU.
+
+    Returns:
+        Loaded WhisperModel
+    """
+    if compute_type is None:
+        compute_type = _default_compute_type(device)
+
+    gpu_count = ctranslate2.get_cuda_device_count() if device == "cuda" else 0
+    device_index = list(range(gpu_count)) if gpu_count > 1 else 0
+
+    print(f"Using device: {device}{f' x{gpu_count}' if gpu_count > 1 else ''} ({compute_type})")
+    model = WhisperModel(
+        model_name,
+        device=device,
+        device_index=device_index,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 0,
+        num_workers=1,
+    )
+    if device == "cuda" and torch is not None and torch.cuda.is_available():
+        model.feature_extractor = GPUFeatureExtractor(model.feature_extractor)
+
+    return model
+
 
 class PodcastTranscriptExtractor:
     """Main class for podcast transcription and extraction."""
 
-    def __init__(self, temp_dir: Optional[str] = None):
+    def __init__(self, temp_dir: Optional[str] = None, compute_type: Optional[str] = None):
         """Initialize the extractor.
 
         Args:
             temp_dir: Directory for temporary files. Uses system temp if not provided.
+            compute_type: CTranslate2 compute type for Whisper (e.g. int8, int8_float16,
+                float16). Defaults to int8_float16 on GPU and int8 on CPU.
         """
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.gettempdir()) / "podcast_transcripts"
         self.temp_dir.mkdir(exist_ok=True, parents=True)
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.compute_type = compute_type or _default_compute_type(self.device)
+
+        if torch is not None and torch.cuda.is_available():
+            # Pin torch work (GPU feature extraction) to the first GPU and let its
+            # float32 matmuls use TF32 tensor cores on Ampere and newer
+            torch.cuda.set_device(0)
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
         self.whisper_model = None
+        self.whisper_pipeline = None
+        self._feed_cache: Dict[str, Dict] = {}
+        self._indexed_feed = None
+        self._title_lower: List[str] = []
+        self._published_lower: List[str] = []
+        self._pub_dates: List[str] = []
+
+        # Conditional GET validators per feed URL, kept across runs
+        self.feed_meta: Dict[str, Dict] = _read_json(self.temp_dir / FEED_META_FILE) or {}
+        self._indexed_transcript = None
+        self._starts = None
+        self._ends = None
+        self._offsets = None
+        self._full_text = None
 
     def fetch_feed(self, feed_url: str) -> Dict:
         """Fetch and parse RSS feed.
 
+        Uses a conditional GET: the ETag / Last-Modified of the previous
+        fetch are sent back, and on 304 Not Modified the feed body cached in
+        the temp directory is reused instead of downloading it again.
+
         Args:
             feed_url: URL of the RSS feed
 
@@ -47,11 +286,57 @@ class PodcastTranscriptExtractor:
             Parsed feed dictionary
         """
         print(f"Fetching feed from: {feed_url}")
-        feed = feedparser.parse(feed_url)
+
+        meta = self.feed_meta.get(feed_url, {})
+        body_path = self.temp_dir / f"feed_{hashlib.sha256(feed_url.encode()).hexdigest()[:16]}.xml"
+
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        if body_path.exists():
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('modified'):
+                headers['If-Modified-Since'] = meta['modified']
+
+        try:
+            response = requests.get(feed_url, headers=headers, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to fetch feed: {e}")
+
+        if response.status_code == 304:
+            print("Feed not modified since last fetch, using cached copy")
+            if feed_url in self._feed_cache:
+                return self._feed_cache[feed_url]
+            body = body_path.read_bytes()
+            content_type = meta.get('content_type', '')
+            location = meta.get('url') or feed_url
+        else:
+            body = response.content
+            content_type = response.headers.get('Content-Type', '')
+            location = response.url
+
+        # The feed's URL lets feedparser resolve relative links and set feed.href
+        feed = feedparser.parse(body, response_headers={
+            'content-type': content_type,
+            'content-location': location,
+        })
 
         if feed.bozo and isinstance(feed.bozo_exception, Exception):
             raise ValueError(f"Failed to parse feed: {feed.bozo_exception}")
-
+        feed['href'] = location
+
+        if response.status_code != 304:
+            _write_atomic(body_path, body)
+            self.feed_meta[feed_url] = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified'),
+                'content_type': content_type,
+                'url': location,
+            }
+            _write_json(self.temp_dir / FEED_META_FILE, self.feed_meta)
+
+        self._feed_cache[feed_url] = feed
+        self._index_feed(feed)
         return feed
 
     def extract_audio_url(self, entry: Dict) -> Optional[str]:
@@ -63,50 +348,37 @@ class PodcastTranscriptExtractor:
         Returns:
             Audio URL or None if not found
         """
-        # Try standard enclosure first
-        if hasattr(entry, 'enclosures') and entry.enclosures:
-            for enclosure in entry.enclosures:
-                if 'audio' in enclosure.get('type', '').lower():
-                    return enclosure.get('href')
-
-        # Try media:content
-        if hasattr(entry, 'media_content') and entry.media_content:
-            for media in entry.media_content:
-                if 'audio' in media.get('type', '').lower():
-                    return media.get('url')
-
-        # Try links
-        if hasattr(entry, 'links'):
-            for link in entry.links:
-                if link.get('type', '').lower().startswith('audio'):
-                    return link.get('href')
+        # Standard enclosure first, then media:content, then links
+        for attr, type_key, url_key in _AUDIO_SOURCES:
+            for item in getattr(entry, attr, None) or ():
+                if _AUDIO_TYPE_RE.search(item.get(type_key, '')):
+                    return item.get(url_key)
 
         # Last resort: check for audio_enclosure_url attribute
-        if hasattr(entry, 'audio_enclosure_url'):
-            return entry.audio_enclosure_url
+        return getattr(entry, 'audio_enclosure_url', None)
 
-        return None
+    def _index_feed(self, feed: Dict) -> None:
+        """Precompute lowercase titles and formatted dates for episode search."""
+        entries = feed.entries
+        self._title_lower = [entry.get('title', '').lower() for entry in entries]
+        published = [entry.get('published', '') for entry in entries]
+        self._published_lower = [p.lower() for p in published]
+        self._pub_dates = [_format_pub_date(p) for p in published]
+        self._indexed_feed = feed
 
     def display_episodes(self, feed: Dict) -> None:
         """Display available episodes to user."""
         print("\nAvailable episodes:")
-        print("-" * 80)
+        print(THIN_RULE)
+
+        if self._indexed_feed is not feed:
+            self._index_feed(feed)
 
         for idx, entry in enumerate(feed.entries[:20], 1):  # Show last 20 episodes
             title = entry.get('title', 'Unknown')
-            published = entry.get('published', 'Unknown')
+            pub_date_str = self._pub_dates[idx - 1] or 'Unknown'
             audio_url = self.extract_audio_url(entry)
 
-            # Format published date if available
-            pub_date_str = published
-            if published != 'Unknown':
-                try:
-                    from email.utils import parsedate_to_datetime
-                    dt = parsedate_to_datetime(published)
-                    pub_date_str = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
-
             audio_status = "✓" if audio_url else "✗"
             print(f"{idx:2d}. [{audio_status}] {title}")
             print(f"    Published: {pub_date_str}")
@@ -143,13 +415,13 @@ class PodcastTranscriptExtractor:
             pass
 
         # Try title/date search
-        search_lower = selection.lower()
-        for idx, entry in enumerate(entries):
-            title = entry.get('title', '').lower()
-            published = entry.get('published', '')
+        if self._indexed_feed is not feed:
+            self._index_feed(feed)
 
-            if search_lower in title or search_lower in published:
-                return entry, idx
+        search_lower = selection.lower()
+        for idx, (title, published, pub_date) in enumerate(zip(self._title_lower, self._published_lower, self._pub_dates)):
+            if search_lower in title or search_lower in published or search_lower in pub_date:
+                return entries[idx], idx
 
         raise ValueError(f"Episode not found: {selection}")
 
@@ -167,7 +439,7 @@ class PodcastTranscriptExtractor:
         audio_url = self.extract_audio_url(entry)
 
         print("\nSelected episode:")
-        print("-" * 80)
+        print(THIN_RULE)
         print(f"Title: {title}")
         print(f"Published: {published}")
         print(f"Audio available: {'Yes' if audio_url else 'No'}")
@@ -190,57 +462,528 @@ class PodcastTranscriptExtractor:
             Path to downloaded file
         """
         print(f"\nDownloading audio from: {audio_url}")
+        audio_path = self._audio_path(audio_url, episode_title)
+
+        try:
+            # Split the download across parallel Range requests when the server allows it
+            head = requests.head(audio_url, allow_redirects=True, timeout=30)
+            total_size = int(head.headers.get('content-length', 0))
+            accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+
+            ranged = head.ok and total_size and accepts_ranges
+            if ranged:
+                try:
+                    asyncio.run(self._download_ranges(head.url, audio_path, total_size))
+                except (RuntimeError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Servers may refuse parallel Range requests (200, 429, ...)
+                    print(f"\nRanged download failed ({e}), retrying over a single connection")
+                    ranged = False
+
+            if not ranged:
+                self._download_stream(audio_url, audio_path)
+
+            print(f"Downloaded to: {audio_path}")
+            return audio_path
 
-        # Create safe filename
-        safe_title = "".join(c for c in episode_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title[:50]  # Limit length
+        except Exception as e:
+            raise RuntimeError(f"Failed to download audio: {e}")
+
+    def _audio_path(self, audio_url: str, episode_title: str) -> Path:
+        """Local path for an episode's audio, named after its title."""
+        # Create safe filename, limited in length
+        safe_title = episode_title.translate(_FILENAME_CHARS)[:50].rstrip()
 
         # Determine file extension from URL
         ext = '.mp3'  # default
         if '.' in audio_url.split('?')[0]:
             ext = '.' + audio_url.split('.')[-1].split('?')[0]
 
-        audio_path = self.temp_dir / f"{safe_title}{ext}"
-
-        try:
-            response = requests.get(audio_url, stream=True, timeout=30)
-            response.raise_for_status()
+        return self.temp_dir / f"{safe_title}{ext}"
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+    def _download_stream(self, audio_url: str, audio_path: Path) -> None:
+        """Download over a single streaming connection."""
+        response = requests.get(audio_url, stream=True, timeout=30)
+        response.raise_for_status()
 
-            with open(audio_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size:
-                            pct = (downloaded / total_size) * 100
-                            print(f"Downloaded: {pct:.1f}%", end='\r')
+        with open(audio_path, 'wb') as f:
+            if not sys.stdout.isatty():
+                # No one sees the progress line, so let copyfileobj do the copy loop
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                return
 
-            print(f"Downloaded to: {audio_path}")
-            return audio_path
+            progress = _DownloadProgress(int(response.headers.get('content-length', 0)))
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    progress.update(len(chunk))
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to download audio: {e}")
+    async def _download_ranges(self, audio_url: str, audio_path: Path, total_size: int,
+                               parts: Optional[List[List[int]]] = None,
+                               data_ready: Optional[asyncio.Event] = None) -> None:
+        """Download with parallel HTTP Range requests written into a memory-mapped file.
 
-    def transcribe_audio(self, audio_path: Path, model_name: str = "base") -> Dict:
-        """Transcribe audio using Whisper.
+        Args:
+            audio_url: URL of audio file (after redirects)
+            audio_path: Destination path
+            total_size: Content-Length reported by the server
+            parts: Filled with the [next byte, end] of each range, updated as
+                it downloads, for readers of the partially written file
+            data_ready: Set whenever bytes are written
+        """
+        part_size = -(-total_size // DOWNLOAD_CONNECTIONS)
+        progress = _DownloadProgress(total_size)
+        if parts is None:
+            parts = []
+        parts[:] = [[start, min(start + part_size, total_size)] for start in range(0, total_size, part_size)]
+
+        with open(audio_path, 'wb') as f:
+            f.truncate(total_size)
+
+        with open(audio_path, 'r+b') as f, mmap.mmap(f.fileno(), total_size) as buf:
+
+            async def fetch_range(session: aiohttp.ClientSession, part: List[int]) -> None:
+                start, end = part[0], part[1] - 1
+                async with session.get(audio_url, headers={'Range': f'bytes={start}-{end}'}) as response:
+                    if response.status != 206:
+                        raise RuntimeError(f"Range request not honoured (HTTP {response.status})")
+
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        buf[part[0]:part[0] + len(chunk)] = chunk
+                        part[0] += len(chunk)
+                        # Coroutines share one thread, so the counters need no lock
+                        progress.update(len(chunk))
+                        if data_ready is not None:
+                            data_ready.set()
+
+                    if part[0] != end + 1:
+                        raise RuntimeError(f"Incomplete range {start}-{end}")
+
+            timeout = aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                tasks = [asyncio.ensure_future(fetch_range(session, part)) for part in parts]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    # Stop the other ranges before the file is unmapped
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+
+    def transcribe_audio(self, audio_path: Path, model_name: str = "base",
+                         batch_size: Optional[int] = None, digest: Optional[str] = None) -> Dict:
+        """Transcribe audio using faster-whisper (CTranslate2).
+
+        Runs on CUDA with int8 weights and float16 activations when a GPU is
+        available, otherwise on CPU with int8 quantized weights (see
+        --compute-type). Silence, music beds and other
+        non-speech audio are skipped with Silero VAD, and the remaining
+        speech chunks are decoded in batches.
+
+        Transcripts are cached in the temp directory keyed by the SHA-256 of
+        the audio file, the model and the compute type, so re-running on the
+        same episode skips Whisper.
 
         Args:
             audio_path: Path to audio file
             model_name: Whisper model size (tiny, base, small, medium, large)
+            batch_size: Speech chunks per forward pass. Defaults to 16 on GPU, 4 on CPU.
+            digest: SHA-256 hex digest of the file, if already known
 
         Returns:
             Transcription dictionary with segments and text
         """
-        print(f"\nLoading Whisper model: {model_name}")
+        if digest is None:
+            digest = self._file_digest(audio_path)
+        cache_path = self._transcript_cache_path(digest, model_name)
+        cached = _read_json(cache_path)
+        if cached is not None:
+            print(f"\nUsing cached transcript: {cache_path}")
+            return cached
+
+        result = self._transcribe(audio_path, model_name, batch_size)
+        _write_json(cache_path, result)
+
+        return result
+
+    def _transcript_cache_path(self, digest: str, model_name: str) -> Path:
+        """Cache file for the transcript of the audio with the given SHA-256."""
+        return self.temp_dir / f"{digest}.{model_name}.{self.compute_type}.json"
+
+    def _file_digest(self, path: Path) -> str:
+        """Return the SHA-256 hex digest of a file, read in 1 MiB blocks."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _use_model(self, model_name: str) -> None:
+        """Point the extractor at a (cached) Whisper model and its batched pipeline."""
+        key = (model_name, self.compute_type)
+        if key not in _MODEL_CACHE:
+            print(f"\nLoading Whisper model: {model_name}")
+            _MODEL_CACHE[key] = _load_model(model_name, self.device, self.compute_type)
+
+        if self.whisper_model is not _MODEL_CACHE[key]:
+            self.whisper_model = _MODEL_CACHE[key]
+            self.whisper_pipeline = BatchedInferencePipeline(model=self.whisper_model)
 
-        if self.whisper_model is None:
-            self.whisper_model = whisper.load_model(model_name)
+    def _transcribe(self, audio_path: Path, model_name: str, batch_size: Optional[int]) -> Dict:
+        """Run Whisper over an audio file (see transcribe_audio)."""
+        self._use_model(model_name)
+
+        if batch_size is None:
+            batch_size = GPU_BATCH_SIZE if self.device == "cuda" else CPU_BATCH_SIZE
 
         print(f"Transcribing audio file: {audio_path}")
-        result = self.whisper_model.transcribe(str(audio_path), verbose=True)
+        wav = self._load_pcm(audio_path)
+        chunks = self._speech_chunks(wav)
+        print(f"Speech detected in {len(chunks)} chunk(s) "
+              f"({sum(e - s for s, e in chunks) / SAMPLE_RATE:.0f}s of {len(wav) / SAMPLE_RATE:.0f}s)")
+
+        if not chunks:
+            return {"text": "", "segments": [], "language": None}
+
+        # Timestamps come back already rebased onto the episode timeline. The
+        # pipeline defaults to one segment per clip; ask for timestamp tokens
+        # so each clip is split into sentence-level segments
+        segments_iter, info = self.whisper_pipeline.transcribe(
+            wav,
+            beam_size=5,
+            batch_size=batch_size,
+            without_timestamps=False,
+            clip_timestamps=[{"start": start, "end": end} for start, end in chunks],
+        )
+
+        segments = []
+        for segment in segments_iter:
+            # Skip speech already transcribed in the previous chunk's overlap:
+            # segments lying mostly before the end of the last one kept
+            if segments and (segment.start + segment.end) / 2 <= segments[-1]["end"]:
+                continue
+            print(f"[{segment.start:7.2f}s -> {segment.end:7.2f}s] {segment.text}")
+            segments.append({"start": segment.start, "end": segment.end, "text": segment.text})
+
+        return {
+            "text": "".join(s["text"] for s in segments),
+            "segments": segments,
+            "language": info.language,
+        }
+
+    def _load_pcm(self, audio_path: Path) -> np.ndarray:
+        """Decode audio to 16 kHz mono float32 PCM in one ffmpeg run.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Audio samples in [-1, 1)
+        """
+        proc = subprocess.run(
+            ["ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "0", "-i", str(audio_path),
+             "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+            capture_output=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to decode audio: {proc.stderr.decode(errors='replace').strip()}")
+
+        return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def _speech_chunks(self, wav) -> List[Tuple[int, int]]:
+        """Group Silero VAD speech regions into Whisper-sized chunks.
+
+        Adjacent speech regions are merged while they fit in a single
+        MAX_CHUNK_SECONDS window. Each chunk after the first starts
+        CHUNK_OVERLAP_SECONDS early so words at the boundary are not cut.
+
+        Args:
+            wav: 16 kHz mono float32 audio
+
+        Returns:
+            List of (start_sample, end_sample) tuples
+        """
+        max_samples = MAX_CHUNK_SECONDS * SAMPLE_RATE
+        overlap = CHUNK_OVERLAP_SECONDS * SAMPLE_RATE
+
+        vad_options = VadOptions(max_speech_duration_s=MAX_CHUNK_SECONDS - CHUNK_OVERLAP_SECONDS)
+        regions = get_speech_timestamps(wav, vad_options, sampling_rate=SAMPLE_RATE)
+
+        chunks = []
+        for region in regions:
+            if chunks and region['end'] - chunks[-1][0] <= max_samples:
+                chunks[-1][1] = region['end']
+            else:
+                start = region['start'] - overlap if chunks else region['start']
+                chunks.append([max(0, start), region['end']])
+
+        return [(start, min(end, len(wav))) for start, end in chunks]
+
+    async def stream_transcribe(self, audio_url: str, episode_title: str, model_name: str = "base",
+                                batch_size: Optional[int] = None) -> Dict:
+        """Download and transcribe an episode concurrently.
+
+        Coroutines form a pipeline: the download writes the audio file at
+        network speed (split across parallel Range requests when the server
+        allows it, like download_audio), a feeder passes the downloaded
+        start of the file to an ffmpeg process decoding to 16 kHz mono PCM, the decoder cuts the PCM into VAD-gated
+        chunks of at most 30 seconds, and the transcribers run Whisper on
+        batches of queued chunks through the batched pipeline. The model
+        loads in a worker thread while the download starts, and Whisper
+        begins on the first chunks instead of waiting for the full download.
+        Only decoding waits on transcription; the download never does.
+
+        If ffmpeg cannot decode the stream (e.g. an M4A whose index is at
+        the end of the file), the finished download is transcribed with
+        transcribe_audio instead.
+
+        The audio is still saved locally, and the transcript is cached like
+        transcribe_audio's, with the audio URL remembered so a repeat run
+        skips both download and transcription.
+
+        Args:
+            audio_url: URL of audio file
+            episode_title: Episode title for file naming
+            model_name: Whisper model size (tiny, base, small, medium, large)
+            batch_size: Speech chunks per forward pass. Defaults to 16 on GPU, 4 on CPU.
+
+        Returns:
+            Transcription dictionary with segments and text
+        """
+        audio_index_path = self.temp_dir / "audio_index.json"
+        audio_index = _read_json(audio_index_path) or {}
+
+        if audio_url in audio_index:
+            cache_path = self._transcript_cache_path(audio_index[audio_url], model_name)
+            cached = _read_json(cache_path)
+            if cached is not None:
+                print(f"\nUsing cached transcript: {cache_path}")
+                return cached
+
+        loop = asyncio.get_running_loop()
+
+        audio_path = self._audio_path(audio_url, episode_title)
+        digest = hashlib.sha256()
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+        segments = []
+        language = None
+
+        # Download state shared with the feeder: the [next byte, end] of each
+        # part of the file being downloaded, in file order
+        parts: List[List[int]] = []
+        download_done = False
+        data_ready = asyncio.Event()
+
+        def downloaded_prefix() -> int:
+            """Length of the fully downloaded start of the file."""
+            for pos, end in parts:
+                if pos < end:
+                    return pos
+            return parts[-1][1] if parts else 0
+
+        print(f"\nStreaming audio from: {audio_url}")
+        # -xerror makes ffmpeg exit non-zero instead of quietly producing no audio;
+        # its messages are dropped since the fallback decode reports its own errors
+        ffmpeg = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error", "-xerror", "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        async def download() -> None:
+            nonlocal download_done
+            timeout = aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+            try:
+                async with aiohttp.ClientSession(timeout=timeout) as session:
+                    # Split the download across parallel Range requests when the server allows it
+                    async with session.head(audio_url, allow_redirects=True) as head:
+                        total_size = head.content_length if head.ok else None
+                        accepts_ranges = head.headers.get('Accept-Ranges', '').lower() == 'bytes'
+                        url = str(head.url)
+
+                    if total_size and accepts_ranges:
+                        try:
+                            await self._download_ranges(url, audio_path, total_size, parts, data_ready)
+                            return
+                        except (RuntimeError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                            # The feeder skips bytes it has already passed on
+                            print(f"\nRanged download failed ({e}), retrying over a single connection")
+
+                    async with session.get(audio_url) as response:
+                        response.raise_for_status()
+                        progress = _DownloadProgress(response.content_length or 0)
+
+                        # Unbuffered, so the feeder sees each chunk as soon as it is written
+                        parts[:] = [[0, sys.maxsize]]
+                        with open(audio_path, 'wb', buffering=0) as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                parts[0][0] += len(chunk)
+                                data_ready.set()
+                                progress.update(len(chunk))
+                        parts[0][1] = parts[0][0]
+            finally:
+                download_done = True
+                data_ready.set()
+
+        async def feed() -> None:
+            # Pass the downloaded start of the file to ffmpeg, hashing it on the
+            # way, so only this side waits on decoding
+            feeding = True
+            try:
+                await data_ready.wait()
+                if not parts:
+                    return  # The download failed before writing anything
+
+                # Unbuffered, so nothing past the downloaded prefix is read ahead
+                with open(audio_path, 'rb', buffering=0) as f:
+                    while True:
+                        data_ready.clear()
+                        done = download_done
+                        available = downloaded_prefix()
+                        while f.tell() < available:
+                            block = f.read(min(DOWNLOAD_CHUNK_SIZE, available - f.tell()))
+                            if not block:
+                                break
+                            digest.update(block)
+                            if not feeding:
+                                continue
+                            try:
+                                ffmpeg.stdin.write(block)
+                                await ffmpeg.stdin.drain()
+                            except (BrokenPipeError, ConnectionResetError):
+                                feeding = False  # ffmpeg gave up on the stream; keep hashing the download
+                        if done:
+                            break
+                        await data_ready.wait()
+            finally:
+                ffmpeg.stdin.close()
+
+        async def decode() -> None:
+            window = MAX_CHUNK_SECONDS * SAMPLE_RATE
+            pending = np.empty(0, dtype=np.float32)
+            offset = 0  # Episode position of pending[0], in samples
+            partial = b''  # Odd trailing byte of a read, completed by the next one
+            eof = False
+
+            while not eof or len(pending):
+                if not eof and len(pending) < window:
+                    pcm = await ffmpeg.stdout.read(window * 2)
+                    eof = not pcm
+                    pcm = partial + pcm
+                    usable = len(pcm) - len(pcm) % 2
+                    partial = pcm[usable:]
+                    samples = np.frombuffer(pcm[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+                    pending = np.concatenate((pending, samples))
+                    continue
+
+                chunk = pending[:window]
+                regions = await loop.run_in_executor(
+                    None, lambda: get_speech_timestamps(chunk, VadOptions(), sampling_rate=SAMPLE_RATE))
+
+                if not regions or len(pending) <= window:
+                    cut = len(chunk)  # No speech to keep, or the end of the episode
+                elif regions[-1]['end'] < len(chunk):
+                    cut = regions[-1]['end']  # Cut in the trailing silence
+                elif len(regions) > 1:
+                    cut = regions[-1]['start']  # Carry the unfinished utterance over
+                else:
+                    cut = len(chunk)  # Uninterrupted speech, cut at the window edge
+
+                if regions:
+                    await chunks.put((offset, chunk[:cut]))
+                pending = pending[cut:]
+                offset += cut
+
+            await chunks.put(None)
+
+        def transcribe_batch(batch: List[Tuple[int, np.ndarray]], language: Optional[str]) -> Tuple[List[Dict], str]:
+            # Lay the chunks end to end and mark each one as a clip for the pipeline
+            bounds = np.cumsum([0] + [len(audio) for _, audio in batch])
+            segments_iter, info = self.whisper_pipeline.transcribe(
+                np.concatenate([audio for _, audio in batch]),
+                beam_size=5,
+                batch_size=len(batch),
+                without_timestamps=False,
+                language=language,
+                clip_timestamps=[{"start": int(start), "end": int(end)} for start, end in zip(bounds[:-1], bounds[1:])],
+            )
+
+            # Move segment times from the concatenated clips back onto the episode timeline
+            clip_starts = bounds[:-1] / SAMPLE_RATE
+            shifts = [offset / SAMPLE_RATE - clip_start for (offset, _), clip_start in zip(batch, clip_starts)]
+
+            batch_segments = []
+            for segment in segments_iter:
+                shift = shifts[max(0, int(np.searchsorted(clip_starts, segment.start, side='right')) - 1)]
+                batch_segments.append({"start": segment.start + shift, "end": segment.end + shift, "text": segment.text})
+            return batch_segments, info.language
+
+        async def transcribe(batch_size: int) -> None:
+            nonlocal language
+            done = False
+            while not done:
+                batch = [await chunks.get()]
+                while len(batch) < batch_size and batch[-1] is not None and not chunks.empty():
+                    batch.append(chunks.get_nowait())
+
+                if batch[-1] is None:
+                    # Leave the end-of-stream marker for the other transcribers
+                    batch.pop()
+                    chunks.put_nowait(None)
+                    done = True
+                if not batch:
+                    continue
+
+                batch_segments, language = await loop.run_in_executor(None, transcribe_batch, batch, language)
+                for segment in batch_segments:
+                    print(f"[{segment['start']:7.2f}s -> {segment['end']:7.2f}s] {segment['text']}")
+                    segments.append(segment)
+
+        if batch_size is None:
+            batch_size = GPU_BATCH_SIZE if self.device == "cuda" else CPU_BATCH_SIZE
+
+        async def transcribe_all() -> None:
+            await loop.run_in_executor(None, self._use_model, model_name)
+
+            # One transcriber per model replica, so batches are spread across GPUs
+            workers = self.whisper_model.model.num_workers
+            await asyncio.gather(*(transcribe(batch_size) for _ in range(workers)))
+
+        try:
+            await asyncio.gather(download(), feed(), decode(), transcribe_all())
+            returncode = await ffmpeg.wait()
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Failed to download audio: {e}")
+        finally:
+            if ffmpeg.returncode is None:
+                ffmpeg.kill()
+                await ffmpeg.wait()
+
+        print(f"Downloaded to: {audio_path}")
+        key = digest.hexdigest()
+
+        if returncode != 0:
+            # Not decodable from a pipe (e.g. MP4 with the moov atom last), but the file is complete
+            print(f"Could not decode the audio while streaming (exit code {returncode}), "
+                  f"transcribing the downloaded file instead")
+            result = await loop.run_in_executor(
+                None, self.transcribe_audio, audio_path, model_name, batch_size, key)
+        else:
+            # Batches may finish out of order when several transcribers run
+            segments.sort(key=lambda s: s["start"])
+            result = {
+                "text": "".join(s["text"] for s in segments),
+                "segments": segments,
+                "language": language,
+            }
+            _write_json(self._transcript_cache_path(key, model_name), result)
+
+        audio_index[audio_url] = key
+        _write_json(audio_index_path, audio_index)
 
         return result
 
@@ -264,6 +1007,28 @@ class PodcastTranscriptExtractor:
         else:
             raise ValueError(f"Invalid timestamp format: {timestamp_str}")
 
+    def _index_transcript(self, transcript: Dict) -> None:
+        """Build segment lookup arrays for a transcript, once per transcript.
+
+        _offsets[i] is the character offset in _full_text where segment i
+        ends, so both share one coordinate system.
+        """
+        if self._indexed_transcript is transcript:
+            return
+
+        segments = transcript.get('segments', [])
+        texts = [s.get('text', '') for s in segments]
+        self._starts = np.fromiter((s.get('start', 0) for s in segments), dtype=np.float64, count=len(segments))
+        self._ends = np.fromiter((s.get('end', 0) for s in segments), dtype=np.float64, count=len(segments))
+        self._offsets = np.cumsum([len(text) for text in texts], dtype=np.int64)
+        self._full_text = "".join(texts)
+        self._indexed_transcript = transcript
+
+    def _segments_in_window(self, transcript: Dict, start_time: float, end_time: float) -> np.ndarray:
+        """Return indices of segments overlapping [start_time, end_time]."""
+        self._index_transcript(transcript)
+        return np.flatnonzero((self._ends >= start_time) & (self._starts <= end_time))
+
     def extract_by_timestamp(self, transcript: Dict, start_time: float, end_time: float, padding: int = 30) -> str:
         """Extract transcript section by timestamp.
 
@@ -282,101 +1047,115 @@ class PodcastTranscriptExtractor:
         padded_start = max(0, start_time - padding)
         padded_end = end_time + padding
 
-        extracted_segments = []
-        for segment in segments:
-            seg_start = segment.get('start', 0)
-            seg_end = segment.get('end', 0)
-
-            if seg_end >= padded_start and seg_start <= padded_end:
-                extracted_segments.append(segment)
+        window = self._segments_in_window(transcript, padded_start, padded_end)
+        in_target = (self._starts[window] >= start_time) & (self._ends[window] <= end_time)
 
         # Format output
-        output = []
-        output.append("=" * 80)
-        output.append("TRANSCRIPT EXTRACT")
-        output.append("=" * 80)
-        output.append(f"\nTarget window: {start_time:.1f}s - {end_time:.1f}s")
-        output.append(f"With {padding}s padding: {padded_start:.1f}s - {padded_end:.1f}s\n")
-        output.append("-" * 80)
-
-        for segment in extracted_segments:
+        buf = io.StringIO()
+        w = buf.write
+        w(EXTRACT_HEADER)
+        w(f"\nTarget window: {start_time:.1f}s - {end_time:.1f}s\n")
+        w(f"With {padding}s padding: {padded_start:.1f}s - {padded_end:.1f}s\n\n")
+        w(THIN_RULE)
+        w("\n")
+
+        for idx, target in zip(window, in_target):
+            segment = segments[idx]
             start = segment.get('start', 0)
             end = segment.get('end', 0)
             text = segment.get('text', '').strip()
 
             # Highlight target section
-            in_target = start >= start_time and end <= end_time
-            marker = ">>>" if in_target else "   "
+            marker = ">>>" if target else "   "
 
-            output.append(f"{marker} [{start:6.1f}s - {end:6.1f}s] {text}")
+            w(f"{marker} [{start:6.1f}s - {end:6.1f}s] {text}\n")
 
-        output.append("-" * 80)
+        w(THIN_RULE)
 
-        return "\n".join(output)
+        return buf.getvalue()
 
-    def extract_by_context(self, transcript: Dict, context: str, padding: int = 30) -> str:
+    def extract_by_context(self, transcript: Dict, context: Union[str, List[str]], padding: int = 30) -> str:
         """Extract transcript section by contextual search.
 
+        Several contexts can be searched at once; the transcript is scanned
+        a single time and the padded windows around the first match of each
+        context are merged into one extract. Contexts that are not found are
+        listed in the extract header.
+
         Args:
             transcript: Whisper transcription result
-            context: Text to search for
+            context: Text to search for, or a list of texts
             padding: Seconds of padding before/after
 
         Returns:
             Extracted transcript text with padding
-        """
-        segments = transcript.get('segments', [])
-        full_text = transcript.get('text', '')
 
-        # Find context in transcript
-        context_lower = context.lower()
-        full_text_lower = full_text.lower()
-
-        match_pos = full_text_lower.find(context_lower)
-        if match_pos == -1:
-            return f"Context not found in transcript: {context}"
+        Raises:
+            ValueError: If no context is given
+        """
+        contexts = [context] if isinstance(context, str) else list(context)
+        if not contexts:
+            raise ValueError("At least one context is required")
 
-        # Find segments containing the match
-        char_count = 0
-        start_segment_idx = None
-        end_segment_idx = None
+        segments = transcript.get('segments', [])
+        self._index_transcript(transcript)
+
+        # One case-insensitive alternation for all contexts, longest first so a
+        # context is not shadowed by a shorter one sharing its prefix
+        order = sorted(range(len(contexts)), key=lambda i: -len(contexts[i]))
+        alternation = "|".join(f"({re.escape(contexts[i])})" for i in order)
+        pattern = re.compile(alternation, re.IGNORECASE)
+
+        # Scan with a lookahead so matches may overlap, e.g. a context inside a
+        # longer one. Only the longest context starting at a position is
+        # captured; the others matching there are its prefixes.
+        lowered = [c.lower() for c in contexts]
+        prefixes = [[j for j, other in enumerate(lowered) if c.startswith(other)] for c in lowered]
+        scan = re.compile(f"(?={alternation})", re.IGNORECASE)
+
+        # First match span of each context
+        matches: Dict[int, Tuple[int, int]] = {}
+        for match in scan.finditer(self._full_text):
+            pos = match.start()
+            for idx in prefixes[order[match.lastindex - 1]]:
+                matches.setdefault(idx, (pos, pos + len(contexts[idx])))
+            if len(matches) == len(contexts):
+                break
 
-        for idx, segment in enumerate(segments):
-            text = segment.get('text', '')
-            char_count += len(text)
+        if not matches:
+            return f"Context not found in transcript: {', '.join(contexts)}"
 
-            if char_count >= match_pos and start_segment_idx is None:
-                start_segment_idx = max(0, idx - 1)
+        if not segments:
+            return f"Could not locate context in segments"
 
-            if char_count >= match_pos + len(context):
-                end_segment_idx = min(len(segments) - 1, idx + 1)
-                break
+        windows = []
+        for match_start, match_end in matches.values():
+            # Find segments containing the match, plus one neighbour either side
+            start_segment_idx = max(0, int(np.searchsorted(self._offsets, match_start)) - 1)
+            end_segment_idx = min(len(segments) - 1, int(np.searchsorted(self._offsets, match_end)) + 1)
 
-        if start_segment_idx is None or end_segment_idx is None:
-            return f"Could not locate context in segments"
+            # Apply padding
+            start_time = segments[start_segment_idx].get('start', 0) - padding
+            end_time = segments[end_segment_idx].get('end', 0) + padding
+            start_time = max(0, start_time)
 
-        # Apply padding
-        start_time = segments[start_segment_idx].get('start', 0) - padding
-        end_time = segments[end_segment_idx].get('end', 0) + padding
-        start_time = max(0, start_time)
+            windows.append(self._segments_in_window(transcript, start_time, end_time))
 
         # Extract segments
-        extracted_segments = []
-        for segment in segments:
-            seg_start = segment.get('start', 0)
-            seg_end = segment.get('end', 0)
-
-            if seg_end >= start_time and seg_start <= end_time:
-                extracted_segments.append(segment)
+        extracted_segments = [segments[idx] for idx in np.unique(np.concatenate(windows))]
 
         # Format output
-        output = []
-        output.append("=" * 80)
-        output.append("TRANSCRIPT EXTRACT")
-        output.append("=" * 80)
-        output.append(f"\nSearching for: \"{context}\"")
-        output.append(f"With {padding}s padding\n")
-        output.append("-" * 80)
+        buf = io.StringIO()
+        w = buf.write
+        w(EXTRACT_HEADER)
+        quoted = ", ".join(f'"{c}"' for c in contexts)
+        w(f"\nSearching for: {quoted}\n")
+        if len(matches) < len(contexts):
+            missing = ", ".join(f'"{c}"' for i, c in enumerate(contexts) if i not in matches)
+            w(f"Not found: {missing}\n")
+        w(f"With {padding}s padding\n\n")
+        w(THIN_RULE)
+        w("\n")
 
         for segment in extracted_segments:
             start = segment.get('start', 0)
@@ -384,27 +1163,17 @@ class PodcastTranscriptExtractor:
             text = segment.get('text', '').strip()
 
             # Highlight matching text
-            if context_lower in text.lower():
-                # Use regex for case-insensitive replacement
-                text_highlighted = re.sub(
-                    f'({re.escape(context)})',
-                    r'>>> \1 <<<',
-                    text,
-                    flags=re.IGNORECASE
-                )
-            else:
-                text_highlighted = text
+            text_highlighted = pattern.sub(r'>>> \g<0> <<<', text)
 
-            output.append(f"[{start:6.1f}s - {end:6.1f}s] {text_highlighted}")
+            w(f"[{start:6.1f}s - {end:6.1f}s] {text_highlighted}\n")
 
-        output.append("-" * 80)
+        w(THIN_RULE)
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     def cleanup(self):
         """Clean up temporary files."""
         try:
-            import shutil
             if self.temp_dir.exists():
                 # Keep transcript cache, remove large audio files
                 for audio_file in self.temp_dir.glob('*.mp3'):
@@ -417,12 +1186,20 @@ class PodcastTranscriptExtractor:
 
 def main():
     """Main entry point for the skill."""
-    extractor = PodcastTranscriptExtractor()
+    parser = argparse.ArgumentParser(description="Podcast Transcript Extraction Skill")
+    parser.add_argument(
+        "--compute-type",
+        help="CTranslate2 compute type for Whisper, e.g. int8, int8_float16, float16 "
+             "(default: int8_float16 on GPU, int8 on CPU)",
+    )
+    args = parser.parse_args()
+
+    extractor = PodcastTranscriptExtractor(compute_type=args.compute_type)
 
     try:
         # Step 1: Get feed URL
         print("Podcast Transcript Extraction Skill")
-        print("=" * 80)
+        print(RULE)
         feed_url = input("\nPodcast RSS Feed URL: ").strip()
 
         # Step 2: Fetch and display episodes
@@ -443,16 +1220,13 @@ def main():
             print("Error: No audio enclosure found for this episode")
             return
 
-        # Step 6: Download audio
-        audio_path = extractor.download_audio(audio_url, entry.get('title', 'episode'))
-
-        # Step 7: Transcribe
-        transcript = extractor.transcribe_audio(audio_path)
+        # Step 6-7: Download and transcribe concurrently
+        transcript = asyncio.run(extractor.stream_transcribe(audio_url, entry.get('title', 'episode')))
 
         # Step 8: Extract section
-        print("\n" + "=" * 80)
+        print("\n" + RULE)
         print("Extract transcript section")
-        print("=" * 80)
+        print(RULE)
 
         extraction_method = input("\nExtract by (t)imestamp or (c)ontext? [t/c]: ").strip().lower()
 